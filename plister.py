@@ -12,14 +12,56 @@ import argparse
 import sys
 import os
 import plistlib
+import re
 import json
 from datetime import datetime
 import base64
-from typing import Iterable, List, Optional, Tuple
+import io
+import mmap
+import stat
+from binascii import b2a_base64
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Set, Tuple
 
 from tqdm import tqdm
 
-# import mmap  # Optionnel : pour les très gros fichiers
+try:  # Optionnel : parseur XML natif (libxml2), plus rapide que plistlib
+    from lxml import etree
+except ImportError:  # pragma: no cover - repli sur plistlib
+    etree = None
+
+try:  # Optionnel : encodeur JSON natif, bien plus rapide que json
+    import orjson
+except ImportError:  # pragma: no cover - repli sur json
+    orjson = None
+
+try:  # Optionnel : encodage base64 vectorisé (SIMD) pour les gros blocs
+    import pybase64
+except ImportError:  # pragma: no cover - repli sur binascii
+    pybase64 = None
+
+# Signature des plists binaires
+BPLIST_MAGIC = b"bplist00"
+# Casses usuelles de l'extension, testées sans copie en minuscules
+PLIST_SUFFIXES = (".plist", ".PLIST", ".Plist")
+# Au-delà de cette taille, le fichier .plist est projeté en mémoire (mmap)
+MMAP_THRESHOLD = 256 * 1024
+# Taille du tampon d'écriture des fichiers JSON (limite le nombre de write())
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Lecture anticipée des fichiers en mode séquentiel
+PREFETCH_THREADS = 4
+PREFETCH_DEPTH = 2 * PREFETCH_THREADS
+# Taille des lots envoyés aux processus de conversion
+DEFAULT_CHUNKSIZE = 8
+MAX_CHUNKSIZE = 64
+# En dessous de cette taille, binascii reste plus rapide que pybase64
+PYBASE64_THRESHOLD = 256
 
 
 def parse_args():
@@ -43,6 +85,13 @@ def parse_args():
         help="Répertoire de sortie quand l'entrée est un dossier (par défaut à côté des fichiers .plist)",
         default=None,
     )
+    parser.add_argument(
+        "--jsonl",
+        metavar="OUT",
+        help="Regroupe la conversion d'un dossier dans un seul fichier JSON Lines "
+        '(une ligne {"path": ..., "data": ...} par plist)',
+        default=None,
+    )
     parser.add_argument(
         "--indent",
         type=int,
@@ -60,102 +109,603 @@ def parse_args():
         action="store_true",
         help="Désactive l'affichage de la barre de progression",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Ignore les fichiers dont le JSON existe et est plus récent "
+        "que le .plist",
+    )
+    parser.add_argument(
+        "--parallel",
+        metavar="N",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Nombre de processus pour la conversion d'un dossier "
+        "(par défaut : nombre de cœurs)",
+    )
     return parser.parse_args()
 
 
-def iter_plist_files(directory: str, recursive: bool) -> List[str]:
-    """Retourne la liste des fichiers .plist dans un dossier."""
-    plist_files: List[str] = []
-    if recursive:
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.lower().endswith(".plist"):
-                    plist_files.append(os.path.join(root, file))
-    else:
-        for entry in os.scandir(directory):
-            if entry.is_file() and entry.name.lower().endswith(".plist"):
-                plist_files.append(entry.path)
-    return sorted(plist_files)
+def iter_plist_entries(directory: str, recursive: bool) -> Iterator[os.DirEntry]:
+    """
+    Génère les DirEntry des fichiers .plist d'un dossier.
+
+    L'extension est reconnue quelle que soit sa casse ; les casses usuelles
+    (PLIST_SUFFIXES) sont testées d'abord, sans copie en minuscules du nom.
+
+    Parcours itératif basé sur os.scandir : les informations de type des
+    DirEntry sont réutilisées et seuls le dossier en cours et les chemins des
+    sous-dossiers en attente sont gardés en mémoire. Comme os.walk, les liens
+    symboliques vers des dossiers ne sont pas suivis et les dossiers
+    illisibles sont ignorés.
+
+    L'ordre est déterministe quel que soit le système de fichiers : entrées
+    de chaque dossier triées par nom, fichiers d'un dossier avant ses
+    sous-dossiers, parcourus en profondeur.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=attrgetter("name"))
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirectories.append(entry.path)
+                continue
+            name = entry.name
+            if (
+                name.endswith(PLIST_SUFFIXES) or name[-6:].lower() == ".plist"
+            ) and entry.is_file():
+                yield entry
+        # Pile : on empile à l'envers pour dépiler dans l'ordre alphabétique
+        stack.extend(reversed(subdirectories))
+
+
+def iter_plist_files(directory: str, recursive: bool) -> Iterator[str]:
+    """Génère les chemins des fichiers .plist d'un dossier."""
+    for entry in iter_plist_entries(directory, recursive):
+        yield entry.path
+
+
+# Séparateurs de chemin de la plateforme (os.altsep vaut None sous POSIX)
+_SEPARATORS = os.sep + (os.altsep or "")
+
+# Dossiers déjà créés (ou vérifiés) par ensure_directory dans ce processus
+_created_directories: Set[str] = set()
+
+
+def is_up_to_date(entry: os.DirEntry, output_path: str) -> bool:
+    """Indique si output_path existe et est au moins aussi récent que le plist."""
+    try:
+        return os.stat(output_path).st_mtime >= entry.stat().st_mtime
+    except OSError:
+        return False
 
 
 def ensure_directory(path: str) -> None:
+    if path in _created_directories:
+        return
     os.makedirs(path, exist_ok=True)
+    _created_directories.add(path)
+
+
+def relative_plist_path(plist_path: str, base_input_dir: str) -> str:
+    """
+    Chemin de plist_path relatif à base_input_dir.
+
+    Cas courant (plist issu d'iter_plist_files(base_input_dir)) : simple
+    découpage de chaîne ; sinon os.path.relpath prend le relais.
+    """
+    prefix = base_input_dir.rstrip(_SEPARATORS) + os.sep
+    if plist_path.startswith(prefix):
+        return plist_path[len(prefix) :]
+    return os.path.relpath(plist_path, base_input_dir)
 
 
 def compute_output_path(
     plist_path: str, base_input_dir: str, output_dir: Optional[str]
 ) -> str:
-    """Calcule le chemin du fichier JSON de sortie pour un plist donné."""
-    directory = output_dir if output_dir else os.path.dirname(plist_path)
+    """
+    Calcule le chemin du fichier JSON de sortie pour un plist donné.
+
+    Sans output_dir, le JSON est placé à côté du plist.
+    """
     if base_input_dir:
-        rel_path = os.path.relpath(plist_path, base_input_dir)
+        directory = output_dir or base_input_dir
+        rel_path = relative_plist_path(plist_path, base_input_dir)
     else:
+        directory = output_dir or os.path.dirname(plist_path)
         rel_path = os.path.basename(plist_path)
 
-    stem, _ = os.path.splitext(rel_path)
-    json_rel_path = f"{stem}.json"
-    output_path = os.path.join(directory, json_rel_path)
-    ensure_directory(os.path.dirname(output_path))
+    # Fast path seulement si le nom de fichier ne se réduit pas à « .plist »
+    # (fichier caché) : splitext le garde alors entier, comme os.path
+    if (
+        rel_path[-6:].lower() == ".plist"
+        and len(rel_path) > 6
+        and rel_path[-7] not in _SEPARATORS
+    ):
+        stem = rel_path[:-6]
+    else:
+        stem, _ = os.path.splitext(rel_path)
+    if directory:
+        output_path = f"{directory.rstrip(_SEPARATORS)}{os.sep}{stem}.json"
+    else:
+        # plist relatif sans dossier (« x.plist ») : sortie dans le dossier courant
+        output_path = f"{stem}.json"
+    output_dir_path = os.path.dirname(output_path)
+    if output_dir_path:
+        ensure_directory(output_dir_path)
     return output_path
 
 
+def _xml_text(element) -> str:
+    """
+    Texte complet d'un élément scalaire, commentaires et instructions exclus.
+
+    Seuls commentaires et instructions peuvent être aplatis : un élément
+    enfant (plistlib n'en garde que le texte de fin) lève une exception.
+    """
+    if len(element) == 0:
+        return element.text or ""
+    _check_scalar(element)
+    return "".join(element.itertext())
+
+
+def _check_scalar(element) -> None:
+    if next(element.iterchildren(etree.Element), None) is not None:
+        raise ValueError(f"élément imbriqué dans <{element.tag}>")
+
+
+def _build_xml_bool(value: bool):
+    def build(element) -> bool:
+        if len(element):
+            _check_scalar(element)
+        return value
+
+    return build
+
+
+def _build_xml_value(element):
+    """Convertit un élément XML de plist en objet Python (comme plistlib)."""
+    builder = _XML_BUILDERS.get(element.tag)
+    if builder is None:
+        raise ValueError(f"élément plist inconnu : {element.tag}")
+    return builder(element)
+
+
+def _build_xml_dict(element) -> dict:
+    result = {}
+    children = element.iterchildren(etree.Element)
+    for key in children:
+        if key.tag != "key":
+            raise ValueError(f"clé attendue dans <dict>, trouvé : {key.tag}")
+        value = next(children, None)
+        if value is None:
+            raise ValueError(f"valeur manquante pour la clé : {_xml_text(key)}")
+        result[_xml_text(key)] = _build_xml_value(value)
+    return result
+
+
+def _build_xml_array(element) -> list:
+    return [_build_xml_value(child) for child in element.iterchildren(etree.Element)]
+
+
+def _build_xml_integer(element) -> int:
+    raw = _xml_text(element)
+    if raw.startswith(("0x", "0X")):
+        return int(raw, 16)
+    return int(raw)
+
+
+# Grammaire des dates de plistlib (_dateParser), reprise à l'identique : les
+# dates ISO 8601 qu'elle refuse doivent échouer ici aussi
+_PLIST_DATE = re.compile(
+    r"(?P<year>\d\d\d\d)(?:-(?P<month>\d\d)(?:-(?P<day>\d\d)"
+    r"(?:T(?P<hour>\d\d)(?::(?P<minute>\d\d)(?::(?P<second>\d\d))?)?)?)?)?Z",
+    re.ASCII,
+)
+_PLIST_DATE_FIELDS = ("year", "month", "day", "hour", "minute", "second")
+
+
+def _build_xml_date(element) -> datetime:
+    match = _PLIST_DATE.match(_xml_text(element))
+    if match is None:
+        raise ValueError(f"date plist invalide : {_xml_text(element)!r}")
+    fields = []
+    for name in _PLIST_DATE_FIELDS:
+        value = match.group(name)
+        if value is None:
+            break
+        fields.append(int(value))
+    return datetime(*fields)
+
+
+_XML_BUILDERS = {
+    "dict": _build_xml_dict,
+    "array": _build_xml_array,
+    "string": _xml_text,
+    "integer": _build_xml_integer,
+    "real": lambda e: float(_xml_text(e)),
+    "true": _build_xml_bool(True),
+    "false": _build_xml_bool(False),
+    "date": _build_xml_date,
+    "data": lambda e: base64.b64decode(_xml_text(e)),
+}
+
+
+def _load_xml_plist(fp):
+    """
+    Charge un plist XML avec lxml.
+
+    Lève une exception pour tout ce que ce chemin rapide ne reproduit pas à
+    l'identique : XML invalide, déclarations d'entités, balises inconnues,
+    plist vide ou à plusieurs valeurs, élément imbriqué dans un scalaire,
+    imbrication trop profonde pour la récursion…
+    """
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+    tree = etree.parse(fp, parser)
+    dtd = tree.docinfo.internalDTD
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise ValueError("déclarations d'entités XML non prises en charge")
+
+    root = tree.getroot()
+    if root.tag == "plist":
+        # plistlib garde la dernière valeur de premier niveau : on ne traite
+        # ici que le cas normal d'une valeur unique
+        values = list(root.iterchildren(etree.Element))
+        if len(values) != 1:
+            raise ValueError("<plist> doit contenir exactement une valeur")
+        root = values[0]
+    return _build_xml_value(root)
+
+
+def _load_plist(fp):
+    """
+    Charge un plist depuis un fichier binaire ouvert.
+
+    Les plists binaires (bplist00) sont confiés directement au parseur
+    binaire de plistlib, sans nouvelle détection de format. Les plists XML
+    passent par lxml lorsqu'il est disponible ; tous les autres cas restent
+    gérés par plistlib, qui fait foi : au moindre écart possible, le chemin
+    lxml est abandonné et le fichier relu par plistlib.
+    """
+    header = fp.read(8)
+    fp.seek(0)
+    if header == BPLIST_MAGIC:
+        return plistlib.load(fp, fmt=plistlib.FMT_BINARY)
+    if etree is None or not header.startswith((b"<?xml", b"<plist")):
+        return plistlib.load(fp)
+
+    try:
+        return _load_xml_plist(fp)
+    except Exception:
+        fp.seek(0)
+        return plistlib.load(fp)
+
+
+@lru_cache(maxsize=None)
+def _json_encoder(indent: Optional[int]) -> json.JSONEncoder:
+    """
+    Encodeur JSON partagé par toutes les conversions d'un même processus.
+
+    Un JSONEncoder est sans état entre deux appels à iterencode : on le
+    construit une seule fois par indentation plutôt qu'à chaque fichier.
+    Sans indentation (indent=None), la sortie est compacte, sur une ligne.
+    """
+    return json.JSONEncoder(
+        ensure_ascii=False,
+        indent=indent,
+        separators=(",", ":") if indent is None else None,
+        default=convert_to_json_serializable,
+    )
+
+
+def _orjson_dumps(data, option: int) -> Optional[bytes]:
+    """
+    Encode data avec orjson, ou retourne None s'il faut passer par json.
+
+    orjson échoue sur les entiers > 64 bits ou les surrogates isolés, et
+    écrit silencieusement null pour NaN/Infinity là où json écrit NaN et
+    Infinity. Un plist ne contient jamais de None (hors <plist/> vide) : tout
+    « null » dans la sortie vient donc d'un réel non fini, ou d'une chaîne
+    contenant ce mot, et l'on se replie alors sur json.
+    """
+    try:
+        encoded = orjson.dumps(
+            data, default=convert_to_json_serializable, option=option
+        )
+    except orjson.JSONEncodeError:
+        return None
+    if b"null" in encoded:
+        return None
+    return encoded
+
+
+def write_json(data, out_fp, indent: int) -> None:
+    """
+    Sérialise data en JSON (UTF-8) dans le flux binaire out_fp.
+
+    Utilise orjson lorsqu'il est disponible et que l'indentation est
+    compatible (orjson ne sait indenter que de 2 espaces) : ses octets sont
+    écrits tels quels, sans couche d'encodage texte. Sinon les fragments
+    produits par json.JSONEncoder.iterencode sont écrits au fil de l'eau,
+    sans construire la chaîne JSON complète en mémoire.
+
+    La sortie de json fait référence. Avec orjson, seule la notation des
+    réels diffère (1e16 au lieu de 1e+16, même valeur).
+    """
+    if orjson is not None and indent == 2:
+        encoded = _orjson_dumps(data, orjson.OPT_INDENT_2)
+        if encoded is not None:
+            out_fp.write(encoded)
+            return
+
+    text_fp = io.TextIOWrapper(out_fp, encoding="utf-8", newline="\n")
+    try:
+        write = text_fp.write
+        for chunk in _json_encoder(indent).iterencode(data):
+            write(chunk)
+    finally:
+        # Vide le tampon texte sans fermer le flux binaire sous-jacent
+        text_fp.detach()
+
+
+def write_json_file(data, output_path: str, indent: int, atomic: bool = False) -> None:
+    """
+    Écrit data en JSON dans output_path.
+
+    Avec atomic, le JSON est d'abord écrit dans un fichier temporaire du même
+    dossier puis renommé : une conversion interrompue (Ctrl-C, disque plein)
+    ne laisse jamais de sortie partielle, que --incremental prendrait pour à
+    jour. Le renommage ne s'applique qu'à une sortie absente ou à un fichier
+    ordinaire (dont le mode est conservé) ; liens symboliques et fichiers
+    spéciaux (/dev/null…) sont toujours écrits en place.
+    """
+    try:
+        target = os.lstat(output_path)
+    except FileNotFoundError:
+        target = None
+    if not atomic or (target is not None and not stat.S_ISREG(target.st_mode)):
+        with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as out_fp:
+            write_json(data, out_fp, indent)
+        return
+
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as out_fp:
+            if target is not None:
+                os.chmod(out_fp.fileno(), stat.S_IMODE(target.st_mode))
+            write_json(data, out_fp, indent)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def encode_json_line(data) -> bytes:
+    """
+    Sérialise data en une ligne JSON compacte (UTF-8, terminée par \\n).
+
+    Même écart de notation des réels avec orjson que pour write_json.
+    """
+    if orjson is not None:
+        encoded = _orjson_dumps(data, orjson.OPT_APPEND_NEWLINE)
+        if encoded is not None:
+            return encoded
+    return (_json_encoder(None).encode(data) + "\n").encode("utf-8")
+
+
+def load_plist_file(
+    plist_path: str, plist_bytes: Optional[bytes] = None
+) -> Tuple[Any, Optional[str]]:
+    """
+    Charge un fichier plist.
+
+    Retourne (données, None) en cas de succès, (None, erreur) sinon.
+    plist_bytes permet de fournir le contenu déjà lu (voir prefetch_files).
+    """
+    try:
+        if plist_bytes is not None:
+            return _load_plist(io.BytesIO(plist_bytes)), None
+        with open(plist_path, "rb") as fp:
+            if os.fstat(fp.fileno()).st_size > MMAP_THRESHOLD:
+                # Évite les copies read()/seek() répétées sur les gros plists
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _load_plist(mm), None
+            return _load_plist(fp), None
+    except plistlib.InvalidFileException:
+        return None, "fichier .plist invalide ou corrompu"
+    except FileNotFoundError:
+        return None, "fichier introuvable"
+    except Exception as e:  # pragma: no cover - garde générique pour robustesse
+        return None, f"erreur de lecture : {e}"
+
+
 def convert_single_plist_to_json(
     plist_path: str,
     output_path: Optional[str],
     indent: int,
     stream_output: bool = False,
+    ensure_output_dir: bool = True,
+    plist_bytes: Optional[bytes] = None,
+    atomic_output: bool = False,
 ) -> Tuple[str, bool, Optional[str]]:
     """
     Convertit un fichier plist et le sérialise en JSON.
 
     Retourne (chemin_plist, succès, erreur éventuelle).
     Si stream_output est True, écrit sur stdout.
+    ensure_output_dir peut être désactivé lorsque le dossier de sortie a déjà
+    été créé (par exemple par compute_output_path).
+    plist_bytes permet de fournir le contenu déjà lu (voir prefetch_files).
+    atomic_output active l'écriture atomique de write_json_file.
     """
-    try:
-        with open(plist_path, "rb") as fp:
-            plist_data = plistlib.load(fp)
-    except plistlib.InvalidFileException:
-        return plist_path, False, "fichier .plist invalide ou corrompu"
-    except FileNotFoundError:
-        return plist_path, False, "fichier introuvable"
-    except Exception as e:  # pragma: no cover - garde générique pour robustesse
-        return plist_path, False, f"erreur de lecture : {e}"
+    plist_data, error = load_plist_file(plist_path, plist_bytes)
+    if error is not None:
+        return plist_path, False, error
 
     try:
         if stream_output or not output_path:
-            json.dump(
-                plist_data,
-                sys.stdout,
-                ensure_ascii=False,
-                indent=indent,
-                default=convert_to_json_serializable,
-            )
-            sys.stdout.write("\n")
+            sys.stdout.flush()
+            write_json(plist_data, sys.stdout.buffer, indent)
+            sys.stdout.buffer.write(b"\n")
+            # Vide le tampon ici : une erreur d'écriture doit être rapportée
+            # par ce bloc, pas à l'arrêt de l'interpréteur
+            sys.stdout.buffer.flush()
         else:
-            ensure_directory(os.path.dirname(output_path))
-            with open(output_path, "w", encoding="utf-8") as out_fp:
-                json.dump(
-                    plist_data,
-                    out_fp,
-                    ensure_ascii=False,
-                    indent=indent,
-                    default=convert_to_json_serializable,
-                )
+            if ensure_output_dir:
+                ensure_directory(os.path.dirname(output_path))
+            write_json_file(plist_data, output_path, indent, atomic=atomic_output)
         return plist_path, True, None
     except Exception as e:  # pragma: no cover - garder message clair
         return plist_path, False, f"erreur de conversion JSON : {e}"
 
 
+def _read_small_file(path: str) -> Optional[bytes]:
+    """
+    Lit entièrement un fichier s'il ne dépasse pas MMAP_THRESHOLD.
+
+    Retourne None pour les gros fichiers (laissés au chemin mmap) et en cas
+    d'erreur, que la conversion rapportera en rouvrant le fichier.
+    """
+    try:
+        with open(path, "rb") as fp:
+            if os.fstat(fp.fileno()).st_size > MMAP_THRESHOLD:
+                return None
+            return fp.read()
+    except OSError:
+        return None
+
+
+def prefetch_files(tasks: Iterable[Tuple]) -> Iterator[Tuple[Tuple, Optional[bytes]]]:
+    """
+    Lit à l'avance, dans des threads, les fichiers des tâches de conversion.
+
+    Le premier élément de chaque tâche est le chemin du plist. Génère
+    (tâche, contenu) dans l'ordre de tasks. Le disque travaille sur
+    les fichiers suivants pendant que le fichier courant est analysé et
+    sérialisé ; au plus PREFETCH_DEPTH lectures sont en cours ou en attente.
+    """
+    with ThreadPoolExecutor(max_workers=PREFETCH_THREADS) as pool:
+        pending: Deque[Tuple[Tuple, Future]] = deque()
+        for task in tasks:
+            pending.append((task, pool.submit(_read_small_file, task[0])))
+            if len(pending) >= PREFETCH_DEPTH:
+                task, future = pending.popleft()
+                yield task, future.result()
+        while pending:
+            task, future = pending.popleft()
+            yield task, future.result()
+
+
+def _convert_task(
+    task: Tuple[str, str, int], plist_bytes: Optional[bytes] = None
+) -> Tuple[str, bool, Optional[str]]:
+    """Point d'entrée des processus de conversion : (plist, sortie, indentation)."""
+    plist_file, output_path, indent = task
+    # Le dossier de sortie a déjà été créé par compute_output_path ; écriture
+    # atomique pour que --incremental ne voie jamais de sortie partielle
+    return convert_single_plist_to_json(
+        plist_file,
+        output_path,
+        indent,
+        stream_output=False,
+        ensure_output_dir=False,
+        plist_bytes=plist_bytes,
+        atomic_output=True,
+    )
+
+
+def _convert_task_to_line(
+    task: Tuple[str, str], plist_bytes: Optional[bytes] = None
+) -> Tuple[str, bool, Optional[str], Optional[bytes]]:
+    """
+    Point d'entrée des conversions JSON Lines : (plist, chemin relatif).
+
+    Retourne (chemin_plist, succès, erreur éventuelle, ligne JSON).
+    """
+    plist_file, rel_path = task
+    plist_data, error = load_plist_file(plist_file, plist_bytes)
+    if error is not None:
+        return plist_file, False, error, None
+    try:
+        line = encode_json_line({"path": rel_path, "data": plist_data})
+    except Exception as e:  # pragma: no cover - garder message clair
+        return plist_file, False, f"erreur de conversion JSON : {e}", None
+    return plist_file, True, None, line
+
+
+def _run_batch(func: Callable, batch: List[Tuple]) -> List[Tuple]:
+    return [func(task) for task in batch]
+
+
+# Un worker tué (OOM sur un plist énorme, signal) casse tout le pool : les
+# fichiers de ses lots et ceux qui restent ne peuvent plus être convertis
+BROKEN_POOL_ERROR = "processus de conversion interrompu (mémoire insuffisante ?)"
+
+
+def _broken_pool_failures(tasks: Iterable[Tuple]) -> Iterator[Tuple]:
+    for task in tasks:
+        yield task[0], False, BROKEN_POOL_ERROR, None
+
+
+def convert_in_pool(
+    executor: ProcessPoolExecutor,
+    func: Callable,
+    tasks: Iterator[Tuple],
+    chunksize: int,
+    max_pending: int,
+) -> Iterator[Tuple]:
+    """
+    Équivalent de executor.map(func, tasks, chunksize=chunksize).
+
+    Contrairement à executor.map, tasks n'est consommé qu'au fur et à mesure :
+    au plus max_pending lots sont soumis à la fois, ce qui borne la mémoire et
+    permet de convertir pendant le parcours du dossier. L'ordre est conservé.
+
+    Si le pool est cassé (BrokenProcessPool), les fichiers des lots perdus et
+    ceux qui restent sont rendus en échec au lieu de lever l'exception.
+    """
+    pending: Deque[Tuple[Future, List[Tuple]]] = deque()
+    batch: List[Tuple] = []
+    try:
+        for batch in iter(lambda: list(islice(tasks, chunksize)), []):
+            pending.append((executor.submit(_run_batch, func, batch), batch))
+            batch = []
+            if len(pending) >= max_pending:
+                yield from pending[0][0].result()
+                pending.popleft()
+        while pending:
+            yield from pending[0][0].result()
+            pending.popleft()
+    except BrokenProcessPool:
+        lost = chain.from_iterable(lost_batch for _, lost_batch in pending)
+        # batch : lot lu mais refusé par submit, pool déjà cassé
+        yield from _broken_pool_failures(chain(lost, batch, tasks))
+
+
 def convert_to_json_serializable(obj):
     """
     Convertit en types JSON-serialisables les types spécifiques de plistlib :
     datetime -> ISO 8601 (chaine), bytes -> chaîne base64.
+
+    Utilisée comme callback default des encodeurs : elle n'est appelée que
+    pour ces feuilles. Un pré-parcours de l'arbre pour les remplacer à
+    l'avance a été mesuré : aucun gain avec json (l'encodeur C n'est jamais
+    utilisé avec indent), et environ 5x plus lent avec orjson.
     """
     if isinstance(obj, datetime):
         return obj.isoformat()
     if isinstance(obj, (bytes, bytearray)):
         # Encode en base64 pour conserver le contenu binaire
-        return base64.b64encode(obj).decode("ascii")
+        if pybase64 is not None and len(obj) >= PYBASE64_THRESHOLD:
+            return pybase64.b64encode_as_string(obj)
+        return b2a_base64(obj, newline=False).decode("ascii")
     # Autres types non pris en charge → TypeError (json.dump lèvera une erreur)
     raise TypeError(f"Type non sérialisable en JSON : {type(obj)}")
 
@@ -170,69 +720,181 @@ def main():
         sys.exit(1)
 
     if os.path.isdir(plist_path):
-        plist_files = iter_plist_files(plist_path, args.recursive)
-        if not plist_files:
+        if args.output and not args.output_dir:
             print(
-                "Aucun fichier .plist trouvé dans le dossier spécifié.",
+                "Option -o/--output réservée aux conversions d'un seul fichier.\n"
+                "Utilisez --output-dir pour choisir un dossier de sortie.",
                 file=sys.stderr,
             )
-            sys.exit(1)
+            sys.exit(2)
 
-        if args.output and not args.output_dir:
+        if args.parallel < 1:
             print(
-                "Option -o/--output réservée aux conversions d'un seul fichier.\n"
-                "Utilisez --output-dir pour choisir un dossier de sortie.",
+                "Erreur : --parallel doit être au moins égal à 1.", file=sys.stderr
+            )
+            sys.exit(2)
+
+        if args.jsonl and (args.output_dir or args.incremental):
+            print(
+                "Erreur : --jsonl n'est compatible ni avec --output-dir "
+                "ni avec --incremental.",
                 file=sys.stderr,
             )
             sys.exit(2)
 
-        base_dir = os.path.abspath(plist_path)
+        # Les fichiers sont convertis au fil du parcours, sans jamais
+        # matérialiser la liste complète. Seule la barre de progression a
+        # besoin du total : il est alors obtenu par une passe de comptage.
+        show_progress = not args.no_progress and sys.stderr.isatty()
+        total: Optional[int] = None
+        if show_progress:
+            total = sum(1 for _ in iter_plist_files(plist_path, args.recursive))
+
+        plist_entries = iter_plist_entries(plist_path, args.recursive)
+        # Il suffit de lire args.parallel entrées pour borner le nombre de
+        # workers, même sans total : pas de pool complet pour 2 fichiers
+        head = list(islice(plist_entries, args.parallel))
+        if not head:
+            print(
+                "Aucun fichier .plist trouvé dans le dossier spécifié.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        plist_entries = chain(head, plist_entries)
+
         output_dir = args.output_dir
         if output_dir:
             output_dir = os.path.abspath(output_dir)
 
-        total = len(plist_files)
-        print(
-            f"Conversion de {total} fichier{'s' if total > 1 else ''} .plist depuis "
-            f"{plist_path}"
-        )
+        if total is not None:
+            print(
+                f"Conversion de {total} fichier{'s' if total > 1 else ''} .plist "
+                f"depuis {plist_path}"
+            )
+        else:
+            print(f"Conversion des fichiers .plist depuis {plist_path}")
 
-        results: List[Tuple[str, bool, Optional[str]]] = []
-        progress_iter: Iterable[str] = plist_files
-        if not args.no_progress and total > 1:
-            progress_iter = tqdm(
-                plist_files,
+        progress: Optional[tqdm] = None
+        if show_progress and total > 1:
+            # Rafraîchissement espacé : sur des milliers de petits fichiers,
+            # redessiner la barre à chaque itération coûte cher
+            progress = tqdm(
                 desc="Progression",
                 unit="fichier",
                 total=total,
                 ncols=80,
+                mininterval=0.5,
+                miniters=max(1, total // 200),
+                smoothing=0.05,
             )
 
-        for plist_file in progress_iter:
-            output_path = compute_output_path(plist_file, base_dir, output_dir)
-            result = convert_single_plist_to_json(
-                plist_file,
-                output_path,
-                args.indent,
-                stream_output=False,
+        skipped = 0
+
+        def iter_tasks() -> Iterator[Tuple]:
+            nonlocal skipped
+            for entry in plist_entries:
+                if args.jsonl:
+                    yield entry.path, relative_plist_path(entry.path, plist_path)
+                    continue
+                output_path = compute_output_path(entry.path, plist_path, output_dir)
+                # Mode incrémental : la date du plist vient du DirEntry
+                if args.incremental and is_up_to_date(entry, output_path):
+                    skipped += 1
+                    if progress is not None:
+                        progress.update()
+                    continue
+                yield entry.path, output_path, args.indent
+
+        tasks = iter_tasks()
+        convert_task = _convert_task_to_line if args.jsonl else _convert_task
+
+        # JSON Lines : un seul fichier de sortie, écrit par ce processus dans
+        # l'ordre du parcours à partir des lignes encodées par les workers
+        sink = None
+        if args.jsonl:
+            jsonl_path = os.path.abspath(args.jsonl)
+            try:
+                ensure_directory(os.path.dirname(jsonl_path))
+                sink = open(jsonl_path, "wb", buffering=OUTPUT_BUFFER_SIZE)
+            except OSError as e:
+                print(
+                    f"Erreur : impossible d'ouvrir {args.jsonl} : {e}",
+                    file=sys.stderr,
+                )
+                sys.exit(2)
+
+        # Chaque fichier est indépendant : on répartit sur plusieurs processus,
+        # sauf si un seul suffit (évite le coût de démarrage du pool).
+        workers = len(head)
+        executor: Optional[ProcessPoolExecutor] = None
+        result_iter: Iterable[Tuple]
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            if total is not None:
+                chunksize = max(1, min(MAX_CHUNKSIZE, total // (4 * workers)))
+            elif workers < args.parallel:
+                # Le dossier entier tient dans head : un fichier par lot
+                chunksize = 1
+            else:
+                chunksize = DEFAULT_CHUNKSIZE
+            result_iter = convert_in_pool(
+                executor, convert_task, tasks, chunksize, 2 * workers
+            )
+        else:
+            # Conversion séquentielle : les lectures disque sont anticipées
+            result_iter = (
+                convert_task(task, plist_bytes)
+                for task, plist_bytes in prefetch_files(tasks)
             )
-            results.append((plist_file, result[1], result[2]))
 
-        success_count = sum(1 for _, ok, _ in results if ok)
-        failure_details = [(path, err) for path, ok, err in results if not ok]
+        processed = 0
+        success_count = 0
+        failure_details: List[Tuple[str, Optional[str]]] = []
+        try:
+            for result in result_iter:
+                path, ok, err = result[:3]
+                processed += 1
+                if ok:
+                    success_count += 1
+                    if sink is not None:
+                        sink.write(result[3])
+                else:
+                    failure_details.append((path, err))
+                if progress is not None:
+                    progress.update()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if progress is not None:
+                progress.close()
+            if sink is not None:
+                sink.close()
 
         print(
-            f"✅ Conversion terminée : {success_count}/{total} fichier"
-            f"{'s' if total > 1 else ''} converti{'s' if success_count > 1 else ''}."
+            f"✅ Conversion terminée : {success_count}/{processed} fichier"
+            f"{'s' if processed > 1 else ''} "
+            f"converti{'s' if success_count > 1 else ''}."
         )
+        if skipped:
+            print(
+                f"⏭️  {skipped} fichier{'s' if skipped > 1 else ''} à jour "
+                f"ignoré{'s' if skipped > 1 else ''}."
+            )
         if failure_details:
             print("❌ Fichiers en erreur :", file=sys.stderr)
-            for path, err in failure_details:
+            for path, err in sorted(failure_details):
                 print(f"  - {path} : {err}", file=sys.stderr)
             sys.exit(3)
         sys.exit(0)
 
     # Chemin fichier unique
+    if args.jsonl:
+        print(
+            "Option --jsonl réservée aux conversions d'un dossier.",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+
     if os.path.isdir(args.output or ""):
         print(
             "Erreur : utilisez -o/--output avec un chemin de fichier, pas un dossier.",
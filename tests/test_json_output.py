@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Sérialisation JSON : la sortie de json fait référence, avec ou sans orjson."""
+
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plister  # noqa: E402
+
+NON_FINITE = {"n": float("nan"), "i": float("inf"), "m": float("-inf"), "x": 1.5}
+
+
+def reference(data, indent):
+    return json.dumps(data, ensure_ascii=False, indent=indent)
+
+
+class NonFiniteFloatTest(unittest.TestCase):
+    def test_write_json_keeps_nan_and_infinity(self):
+        out = io.BytesIO()
+        plister.write_json(NON_FINITE, out, 2)
+        self.assertEqual(out.getvalue().decode("utf-8"), reference(NON_FINITE, 2))
+
+    def test_json_line_keeps_nan_and_infinity(self):
+        line = plister.encode_json_line(NON_FINITE).decode("utf-8")
+        self.assertEqual(json.loads(line).keys(), NON_FINITE.keys())
+        self.assertIn("NaN", line)
+        self.assertIn("-Infinity", line)
+
+    def test_null_inside_strings_is_preserved(self):
+        data = {"s": "null", "t": "nullable"}
+        out = io.BytesIO()
+        plister.write_json(data, out, 2)
+        self.assertEqual(json.loads(out.getvalue()), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
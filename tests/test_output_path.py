@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Calcul des chemins de sortie (compute_output_path)."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plister  # noqa: E402
+
+
+class ComputeOutputPathTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_next_to_plist_in_subdirectory(self):
+        plist = os.path.join(self.base, "sub", "x.plist")
+        self.assertEqual(
+            plister.compute_output_path(plist, self.base, None),
+            os.path.join(self.base, "sub", "x.json"),
+        )
+
+    def test_mirrors_tree_in_output_dir(self):
+        out = os.path.join(self.base, "json")
+        plist = os.path.join(self.base, "sub", "x.PLIST")
+        result = plister.compute_output_path(plist, self.base, out)
+        self.assertEqual(result, os.path.join(out, "sub", "x.json"))
+        self.assertTrue(os.path.isdir(os.path.dirname(result)))
+
+    def test_base_with_trailing_separator(self):
+        plist = os.path.join(self.base, "x.plist")
+        self.assertEqual(
+            plister.compute_output_path(plist, self.base + os.sep, None),
+            os.path.join(self.base, "x.json"),
+        )
+
+    def test_hidden_plist_named_only_extension(self):
+        for rel in (".plist", os.path.join("sub", ".PLIST")):
+            with self.subTest(rel=rel):
+                plist = os.path.join(self.base, rel)
+                self.assertEqual(
+                    plister.compute_output_path(plist, self.base, None),
+                    plist + ".json",
+                )
+
+    def test_short_name_keeps_fast_path(self):
+        plist = os.path.join(self.base, "a.plist")
+        self.assertEqual(
+            plister.compute_output_path(plist, self.base, None),
+            os.path.join(self.base, "a.json"),
+        )
+
+    def test_bare_file_name_stays_relative(self):
+        self.assertEqual(plister.compute_output_path("x.plist", "", None), "x.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
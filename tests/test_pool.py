@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Conversion par lots dans un pool de processus (convert_in_pool)."""
+
+import os
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plister  # noqa: E402
+
+
+def _convert(task):
+    if task[0] == "crash":
+        # Simule un worker tué par le système (OOM)
+        os._exit(1)
+    return task[0], True, None
+
+
+class ConvertInPoolTest(unittest.TestCase):
+    def run_pool(self, names, chunksize=2, max_pending=2):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return list(
+                plister.convert_in_pool(
+                    executor,
+                    _convert,
+                    iter([(name,) for name in names]),
+                    chunksize,
+                    max_pending,
+                )
+            )
+
+    def test_order_is_preserved(self):
+        names = [f"f{i}" for i in range(11)]
+        self.assertEqual([r[0] for r in self.run_pool(names)], names)
+
+    def test_broken_pool_reports_every_file(self):
+        names = ["a", "b", "crash", "c"] + [f"f{i}" for i in range(10)]
+        results = self.run_pool(names)
+        self.assertCountEqual([r[0] for r in results], names)
+        self.assertIn("crash", [r[0] for r in results if not r[1]])
+        self.assertTrue(
+            all(r[2] == plister.BROKEN_POOL_ERROR for r in results if not r[1])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
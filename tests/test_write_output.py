@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Écriture des fichiers JSON de sortie (write_json_file)."""
+
+import json
+import os
+import plistlib
+import stat
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plister  # noqa: E402
+
+
+class WriteOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.plist = os.path.join(self.tmp.name, "x.plist")
+        with open(self.plist, "wb") as fp:
+            plistlib.dump({"a": 1}, fp)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def convert(self, output_path, **kwargs):
+        _, ok, err = plister.convert_single_plist_to_json(
+            self.plist, output_path, 2, **kwargs
+        )
+        self.assertTrue(ok, err)
+
+    def test_output_symlink_is_written_through(self):
+        target = os.path.join(self.tmp.name, "cible.json")
+        link = os.path.join(self.tmp.name, "lien.json")
+        open(target, "w").close()
+        os.symlink(target, link)
+        for atomic in (False, True):
+            self.convert(link, atomic_output=atomic)
+            self.assertTrue(os.path.islink(link))
+            with open(target, encoding="utf-8") as fp:
+                self.assertEqual(json.load(fp), {"a": 1})
+
+    @unittest.skipUnless(os.name == "posix", "nécessite /dev/null")
+    def test_output_special_file_is_written_in_place(self):
+        for atomic in (False, True):
+            self.convert(os.devnull, atomic_output=atomic)
+            self.assertTrue(stat.S_ISCHR(os.stat(os.devnull).st_mode))
+
+    def test_atomic_output_keeps_mode_and_leaves_no_temp_file(self):
+        output = os.path.join(self.tmp.name, "x.json")
+        open(output, "w").close()
+        os.chmod(output, 0o600)
+        self.convert(output, atomic_output=True)
+        self.assertEqual(stat.S_IMODE(os.stat(output).st_mode), 0o600)
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["x.json", "x.plist"])
+
+
+if __name__ == "__main__":
+    unittest.main()
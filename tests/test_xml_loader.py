@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Parité du chargeur XML basé sur lxml avec plistlib.loads.
+
+Lancement : python -m unittest discover -s tests
+"""
+
+import io
+import os
+import plistlib
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plister  # noqa: E402
+
+HEADER = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+
+
+def make_plist(body: bytes, doctype: bytes = b"") -> bytes:
+    return HEADER + doctype + b"<plist version=\"1.0\">" + body + b"</plist>"
+
+
+FULL_DOCUMENT = make_plist(
+    b"<dict>"
+    b"<key>chaine</key><string>\xc3\xa9t\xc3\xa9 &amp; hiver</string>"
+    b"<key>vide</key><string/>"
+    b"<key>entier</key><integer>-42</integer>"
+    b"<key>hexa</key><integer>0x1F</integer>"
+    b"<key>reel</key><real>1.5</real>"
+    b"<key>vrai</key><true/>"
+    b"<key>faux</key><false/>"
+    b"<key>date</key><date>2020-01-02T03:04:05Z</date>"
+    b"<key>donnees</key><data>\n  AAECAw==\n</data>"
+    b"<key>tableau</key><array><integer>1</integer><dict/></array>"
+    b"</dict>"
+)
+
+# Texte coupé par des commentaires : e.text seul ne verrait que le début
+COMMENTED_DOCUMENT = make_plist(
+    b"<dict>"
+    b"<key>a<!-- c -->b</key><string>x<!-- c -->y</string>"
+    b"<key>entier</key><integer>1<!-- c -->2</integer>"
+    b"<key>reel</key><real>1.<!-- c -->5</real>"
+    b"<key>date</key><date>2020-01-02<!-- c -->T03:04:05Z</date>"
+    b"<key>donnees</key><data>AAEC<!-- c -->Aw==</data>"
+    b"</dict>"
+)
+
+
+def load_with_plister(data: bytes):
+    return plister._load_plist(io.BytesIO(data))
+
+
+@unittest.skipIf(plister.etree is None, "lxml n'est pas installé")
+class XmlLoaderParityTest(unittest.TestCase):
+    def assert_parity(self, data: bytes):
+        try:
+            expected = plistlib.loads(data)
+        except Exception as e:
+            with self.assertRaises(type(e)):
+                load_with_plister(data)
+        else:
+            self.assertEqual(load_with_plister(data), expected)
+
+    def test_full_document_uses_fast_path(self):
+        value = plister._load_xml_plist(io.BytesIO(FULL_DOCUMENT))
+        self.assertEqual(value, plistlib.loads(FULL_DOCUMENT))
+
+    def test_text_split_by_comments_uses_fast_path(self):
+        value = plister._load_xml_plist(io.BytesIO(COMMENTED_DOCUMENT))
+        self.assertEqual(value, plistlib.loads(COMMENTED_DOCUMENT))
+        self.assertEqual(value["ab"], "xy")
+
+    def test_dates_follow_plistlib_grammar(self):
+        for date in (
+            b"2020-01-02T03:04:05Z",
+            b"2020-01-02T03:04Z",
+            b"2020-01-02Z",
+            b"2020-01-02T03:04:05",
+            b"2020-01-02T03:04:05.5Z",
+            b"2020-01-02T03:04:05+02:00Z",
+            b"2020-01-02 03:04:05Z",
+            b"20200102T030405Z",
+            b" 2020-01-02T03:04:05Z",
+        ):
+            with self.subTest(date=date):
+                self.assert_parity(make_plist(b"<date>" + date + b"</date>"))
+
+    def test_entity_declarations_are_rejected(self):
+        data = make_plist(
+            b"<string>&x;</string>",
+            doctype=b'<!DOCTYPE plist [<!ENTITY x "boom">]>',
+        )
+        with self.assertRaises(plistlib.InvalidFileException):
+            plistlib.loads(data)
+        with self.assertRaises(plistlib.InvalidFileException):
+            load_with_plister(data)
+
+    def test_apple_doctype_is_accepted(self):
+        self.assert_parity(
+            make_plist(
+                b"<string>a</string>",
+                doctype=b'<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
+                b'"http://www.apple.com/DTDs/PropertyList-1.0.dtd">',
+            )
+        )
+
+    def test_unknown_tags(self):
+        self.assert_parity(
+            make_plist(b"<dict><key>a</key><string>b</string><inconnu/></dict>")
+        )
+
+    def test_several_top_level_values(self):
+        self.assert_parity(make_plist(b"<string>a</string><string>b</string>"))
+
+    def test_elements_nested_in_scalars(self):
+        for body in (
+            b"<string>a<b>z</b>c</string>",
+            b"<dict><key>a<b>z</b>c</key><string>v</string></dict>",
+            b"<integer>1<b>2</b>3</integer>",
+            b"<true><string>a</string></true>",
+        ):
+            with self.subTest(body=body):
+                self.assert_parity(make_plist(body))
+
+    def test_empty_plist(self):
+        self.assert_parity(make_plist(b""))
+
+    def test_deep_nesting(self):
+        depth = 3000
+        value = load_with_plister(
+            make_plist(b"<array>" * depth + b"</array>" * depth)
+        )
+        # Comparaison itérative : == récursif dépasserait la pile
+        for _ in range(depth - 1):
+            self.assertEqual(len(value), 1)
+            value = value[0]
+        self.assertEqual(value, [])
+
+
+if __name__ == "__main__":
+    unittest.main()